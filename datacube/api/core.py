@@ -478,7 +478,8 @@ class Datacube(object):
         """
         if dask_chunks is None:
             def data_func(measurement):
-                data = numpy.full(sources.shape + geobox.shape, measurement['nodata'], dtype=measurement['dtype'])
+                # reproject_and_fuse() fills each slice with nodata before reading into it
+                data = numpy.empty(sources.shape + geobox.shape, dtype=measurement['dtype'])
                 for index, datasets in numpy.ndenumerate(sources.values):
                     _fuse_measurement(data[index], datasets, geobox, measurement, fuse_func=fuse_func,
                                       skip_broken_datasets=skip_broken_datasets)
@@ -534,7 +535,7 @@ class Datacube(object):
 
 def fuse_lazy(datasets, geobox, measurement, fuse_func=None, prepend_dims=0):
     prepend_shape = (1,) * prepend_dims
-    data = numpy.full(geobox.shape, measurement['nodata'], dtype=measurement['dtype'])
+    data = numpy.empty(geobox.shape, dtype=measurement['dtype'])
     _fuse_measurement(data, datasets, geobox, measurement, fuse_func)
     return data.reshape(prepend_shape + geobox.shape)
 
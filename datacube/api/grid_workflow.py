@@ -3,7 +3,6 @@ from __future__ import absolute_import, division, print_function
 import logging
 import numpy
 import xarray
-from itertools import groupby
 from collections import OrderedDict
 import warnings
 
@@ -27,6 +26,34 @@ def _fast_slice(array, indexers):
     return xarray.DataArray(variable, coords=coords, fastpath=True)
 
 
+def _extent_bounds(extents):
+    """
+    Bounding boxes of `extents`, packed into an (N, 4) array of ``(left, bottom, right, top)`` rows.
+
+    :param list[datacube.utils.geometry.Geometry] extents:
+    :rtype: numpy.ndarray
+    """
+    bounds = numpy.empty((len(extents), 4), dtype='float64')
+    for i, extent in enumerate(extents):
+        bbox = extent.boundingbox
+        bounds[i] = bbox.left, bbox.bottom, bbox.right, bbox.top
+    return bounds
+
+
+def _bounds_overlap(bounds, bbox):
+    """
+    Mask of the rows in `bounds` whose interiors overlap `bbox`.
+
+    Boxes that only touch don't overlap, matching :func:`datacube.utils.intersects`.
+
+    :param numpy.ndarray bounds: as returned by :func:`_extent_bounds`
+    :param datacube.utils.geometry.BoundingBox bbox:
+    :rtype: numpy.ndarray
+    """
+    return ((bounds[:, 0] < bbox.right) & (bounds[:, 2] > bbox.left) &
+            (bounds[:, 1] < bbox.top) & (bounds[:, 3] > bbox.bottom))
+
+
 class Tile(object):
     """
     The Tile object holds a lightweight representation of a datacube result.
@@ -161,9 +188,12 @@ class GridWorkflow(object):
             geobox = geobox.buffered(*tile_buffer) if tile_buffer else geobox
 
             datasets, query = self._find_datasets(geobox.extent, indexers)
-            for dataset in datasets:
-                if intersects(geobox.extent, dataset.extent.to_crs(self.grid_spec.crs)):
-                    add_dataset_to_cells(cell_index, geobox, dataset)
+            extents = [dataset.extent.to_crs(self.grid_spec.crs) for dataset in datasets]
+            # Cheap vectorised bounding box test first, exact geometry test only on the candidates
+            candidates = numpy.flatnonzero(_bounds_overlap(_extent_bounds(extents), geobox.extent.boundingbox))
+            for i in candidates:
+                if intersects(geobox.extent, extents[i]):
+                    add_dataset_to_cells(cell_index, geobox, datasets[i])
             return cells
         else:
             datasets, query = self._find_datasets(geopolygon, indexers)
@@ -244,16 +274,21 @@ class GridWorkflow(object):
         """
         tiles = {}
         for cell_index, observation in observations.items():
-            observation['datasets'].sort(key=group_by.group_by_func)
-            groups = [(key, tuple(group)) for key, group in groupby(observation['datasets'], group_by.group_by_func)]
-
-            for key, datasets in groups:
+            datasets = observation['datasets']
+            # Evaluate each dataset's group key only once, and sort and group on the datetime64 values
+            keys = numpy.array([group_by.group_by_func(dataset) for dataset in datasets], dtype='datetime64[ns]')
+            order = numpy.argsort(keys, kind='mergesort')
+            sorted_keys = keys[order]
+            _, starts = numpy.unique(sorted_keys, return_index=True)
+            ends = numpy.append(starts[1:], len(order))
+
+            for start, end in zip(starts, ends):
                 data = numpy.empty(1, dtype=object)
-                data[0] = datasets
+                data[0] = tuple(datasets[i] for i in order[start:end])
                 variable = xarray.Variable((group_by.dimension,), data,
                                            fastpath=True)
                 coord = xarray.Variable((group_by.dimension,),
-                                        numpy.array([key], dtype='datetime64[ns]'),
+                                        sorted_keys[start:start + 1],
                                         attrs={'units': group_by.units},
                                         fastpath=True)
                 coords = OrderedDict([(group_by.dimension, coord)])
@@ -675,7 +675,15 @@ class DatasetResource(object):
             warnings.warn('"skip_sources" is deprecated, use "sources_policy"', DeprecationWarning)
             sources_policy = 'skip'
         self._add_sources(dataset, sources_policy)
+        self._add_dataset(dataset)
+        return dataset
+
+    def _add_dataset(self, dataset):
+        """
+        Index a single dataset, assuming its sources are already indexed.
 
+        :param datacube.model.Dataset dataset: dataset to add
+        """
         sources_tmp = dataset.type.dataset_reader(dataset.metadata_doc).sources
         dataset.type.dataset_reader(dataset.metadata_doc).sources = {}
         try:
@@ -700,8 +708,6 @@ class DatasetResource(object):
         finally:
             dataset.type.dataset_reader(dataset.metadata_doc).sources = sources_tmp
 
-        return dataset
-
     def search_product_duplicates(self, product, *group_fields):
         # type: (DatasetType, Iterable[Union[str, Field]]) -> Iterable[tuple, Set[UUID]]
         """
@@ -734,16 +740,34 @@ class DatasetResource(object):
         if dataset.sources is None:
             raise ValueError("Dataset has missing (None) sources. Was this loaded without include_sources=True?")
 
-        if sources_policy == 'ensure':
-            for source in dataset.sources.values():
-                if not self.has(source.id):
-                    self.add(source, sources_policy=sources_policy)
-        elif sources_policy == 'verify':
-            for source in dataset.sources.values():
-                self.add(source, sources_policy=sources_policy)
-        elif sources_policy != 'skip':
+        if sources_policy == 'skip':
+            return
+        if sources_policy not in ('verify', 'ensure'):
             raise ValueError('sources_policy must be one of ("verify", "ensure", "skip")')
 
+        # Walk the lineage with an explicit stack rather than recursing through add(). Each source is
+        # pushed twice: once to expand its own sources, and again to index it after they have been.
+        # Ancestors shared by several sources are only visited once.
+        seen = set()
+        stack = [(source, False) for source in reversed(list(dataset.sources.values()))]
+        while stack:
+            source, expanded = stack.pop()
+            if expanded:
+                self._add_dataset(source)
+                continue
+
+            if source.id in seen:
+                continue
+            seen.add(source.id)
+
+            if sources_policy == 'ensure' and self.has(source.id):
+                continue
+            if source.sources is None:
+                raise ValueError("Dataset has missing (None) sources. Was this loaded without include_sources=True?")
+
+            stack.append((source, True))
+            stack.extend((parent, False) for parent in reversed(list(source.sources.values())))
+
     def can_update(self, dataset, updates_allowed=None):
         """
         Check if dataset can be updated. Return bool,safe_changes,unsafe_changes
@@ -1044,8 +1068,8 @@ class DatasetResource(object):
             try:
                 was_inserted = transaction.insert_dataset(dataset.metadata_doc, dataset.id, product.id)
 
-                for classifier, source_dataset in dataset.sources.items():
-                    transaction.insert_dataset_source(classifier, dataset.id, source_dataset.id)
+                transaction.insert_dataset_sources([(classifier, dataset.id, source_dataset.id)
+                                                    for classifier, source_dataset in dataset.sources.items()])
 
                 # try to update location in the same transaction as insertion.
                 # if insertion fails we'll try updating location later
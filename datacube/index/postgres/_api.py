@@ -11,6 +11,8 @@ Persistence API implementation for postgres.
 """
 import logging
 
+from cachetools.func import lru_cache
+
 from sqlalchemy import cast
 from sqlalchemy import delete
 from sqlalchemy import select, text, bindparam, and_, or_, func, literal, distinct
@@ -87,7 +89,17 @@ def _split_uri(uri):
 
 
 def get_native_fields():
-    # Native fields (hard-coded into the schema)
+    """
+    Native fields (hard-coded into the schema), as a new dict that's safe for the caller to extend.
+
+    :rtype: dict[str, NativeField]
+    """
+    return dict(_native_fields())
+
+
+@lru_cache()
+def _native_fields():
+    # The fields and their columns never change, so only build them once.
     fields = {
         'id': NativeField(
             'id',
@@ -255,13 +267,21 @@ class PostgresDbAPI(object):
             )
         ).fetchall()
 
-    def insert_dataset_source(self, classifier, dataset_id, source_dataset_id):
+    def insert_dataset_sources(self, sources):
+        """
+        Link datasets to their sources, using a single multi-row insert.
+
+        :param sources: (classifier, dataset_id, source_dataset_id) tuples
+        :type sources: list[(str, uuid.UUID, uuid.UUID)]
+        """
+        if not sources:
+            return
         try:
             self._connection.execute(
-                DATASET_SOURCE.insert(),
-                classifier=classifier,
-                dataset_ref=dataset_id,
-                source_dataset_ref=source_dataset_id
+                DATASET_SOURCE.insert().values([
+                    dict(classifier=classifier, dataset_ref=dataset_id, source_dataset_ref=source_dataset_id)
+                    for classifier, dataset_id, source_dataset_id in sources
+                ])
             )
         except IntegrityError as e:
             if e.orig.pgcode == PGCODE_UNIQUE_CONSTRAINT:
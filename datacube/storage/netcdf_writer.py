@@ -100,6 +100,11 @@ def create_variable(nco, name, var, set_crs=False, attrs=None, **kwargs):
         maxsizes = [len(nco.dimensions[dim]) for dim in var.dims]
         kwargs['chunksizes'] = [min(chunksize, maxsize) if chunksize and maxsize else chunksize
                                 for maxsize, chunksize in zip(maxsizes, kwargs['chunksizes'])]
+        # A single chunk covering the whole variable is slower to write than contiguous storage,
+        # unless a filter is requested (HDF5 only filters chunked data)
+        if kwargs['chunksizes'] == maxsizes and not (kwargs.get('zlib') or kwargs.get('fletcher32')):
+            del kwargs['chunksizes']
+            kwargs['contiguous'] = True
 
     assert var.dtype.kind != 'U'  # Creates Non CF-Compliant NetCDF File
     if var.dtype.kind == 'S' and var.dtype.itemsize > 1:
@@ -204,9 +209,10 @@ def create_grid_mapping_variable(nco, crs):
     crs_var.semi_major_axis = crs.semi_major_axis
     crs_var.semi_minor_axis = crs.semi_minor_axis
     crs_var.inverse_flattening = crs.inverse_flattening
-    crs_var.crs_wkt = crs.wkt
 
-    crs_var.spatial_ref = crs.wkt
+    wkt = crs.wkt
+    crs_var.crs_wkt = wkt
+    crs_var.spatial_ref = wkt
 
     dims = crs.dimensions
     xres, xoff = data_resolution_and_offset(nco[dims[1]])
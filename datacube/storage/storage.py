@@ -330,7 +330,7 @@ class OverrideBandDataSource(object):
         return self.source.ds.read(indexes=self.source.bidx, window=window, out_shape=out_shape)
 
     def reproject(self, dest, dst_transform, dst_crs, dst_nodata, resampling, **kwargs):
-        source = self.read(self.source)  # TODO: read only the part the we care about
+        source = self.read()  # TODO: read only the part the we care about
         return rasterio.warp.reproject(source,
                                        dest,
                                        src_transform=self.transform,
@@ -535,8 +535,10 @@ def create_netcdf_storage_unit(filename,
 
     netcdf_writer.create_grid_mapping_variable(nco, crs)
 
+    # Every variable shares the same CRS, so only ask OSR for its dimensions once
+    crs_dimensions = crs.dimensions
     for name, variable in variables.items():
-        set_crs = all(dim in variable.dims for dim in crs.dimensions)
+        set_crs = all(dim in variable.dims for dim in crs_dimensions)
         var_params = variable_params.get(name, {})
         data_var = netcdf_writer.create_variable(nco, name, variable, set_crs=set_crs, **var_params)
 
@@ -583,7 +585,48 @@ def write_dataset_to_netcdf(dataset, filename, global_attributes=None, variable_
                                      global_attributes,
                                      netcdfparams)
 
-    for name, variable in dataset.data_vars.items():
-        nco[name][:] = netcdf_writer.netcdfy_data(variable.values)
+    try:
+        for name, variable in dataset.data_vars.items():
+            data = netcdf_writer.netcdfy_data(variable.values)
+            # Variables are created with their nodata as the fill value, so unwritten data already reads as nodata
+            if _is_all_nodata(data, variable.attrs.get('nodata')):
+                continue
+            nco[name][:] = data
+    finally:
+        nco.close()
+
+
+def _is_all_nodata(data, nodata, block_size=2 ** 16):
+    """
+    Is every value in the numeric array `data` equal to `nodata`?
+
+    >>> _is_all_nodata(numpy.full((2, 2), -999, dtype='int16'), -999)
+    True
+    >>> _is_all_nodata(numpy.array([-999, 1], dtype='int16'), -999)
+    False
+    >>> _is_all_nodata(numpy.array([1, -999], dtype='int16'), -999)
+    False
+    >>> _is_all_nodata(numpy.array([-999, -999, -999, 1], dtype='int16'), -999, block_size=2)
+    False
+    >>> _is_all_nodata(numpy.full((2, 2), numpy.nan), float('nan'))
+    True
+    >>> _is_all_nodata(numpy.zeros(2), None)
+    False
+    """
+    if nodata is None or data.dtype.kind not in 'iuf':
+        return False
 
-    nco.close()
+    if data.dtype.kind == 'f' and numpy.isnan(nodata):
+        def is_nodata(values):
+            return numpy.isnan(values)
+    else:
+        def is_nodata(values):
+            return values == nodata
+
+    # Compare a block at a time: a tile with real data stops at the first block holding some, even when
+    # its corner is nodata (as on edge tiles), and no boolean array the size of the band is allocated.
+    flat = data.reshape(-1)
+    for start in range(0, flat.size, block_size):
+        if not is_nodata(flat[start:start + block_size]).all():
+            return False
+    return True
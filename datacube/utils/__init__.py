@@ -236,6 +236,25 @@ class NoDatesSafeLoader(SafeLoader):  # pylint: disable=too-many-ancestors
 NoDatesSafeLoader.remove_implicit_resolver('tag:yaml.org,2002:timestamp')
 
 
+try:
+    import ujson  # pylint: disable=wrong-import-position
+
+    try:
+        # ujson 1.x rounds decoded floats unless asked not to, which would make coordinates differ from
+        # documents loaded with the json module. ujson 2+ is always exact and no longer takes the option.
+        ujson.loads('0.1', precise_float=True)
+        _UJSON_OPTIONS = {'precise_float': True}
+    except TypeError:
+        _UJSON_OPTIONS = {}
+
+
+    def _load_json(stream):
+        return ujson.load(stream, **_UJSON_OPTIONS)
+except ImportError:
+    def _load_json(stream):
+        return json.load(stream)
+
+
 def read_documents(*paths):
     """
     Read & parse documents from the filesystem (yaml or json).
@@ -267,7 +286,7 @@ def read_documents(*paths):
                 raise InvalidDocException('Failed to load %s: %s' % (path, e))
         elif suffix == '.json':
             try:
-                yield path, json.load(opener(str(path), 'r'))
+                yield path, _load_json(opener(str(path), 'r'))
             except ValueError as e:
                 raise InvalidDocException('Failed to load %s: %s' % (path, e))
         elif suffix == '.nc':
@@ -560,6 +579,8 @@ def _set_doc_offset(offset, document, value):
 
 
 class DocReader(object):
+    __slots__ = ('_doc', '_search_fields', '_system_offsets')
+
     def __init__(self, type_definition, search_fields, doc):
         """
         :type system_offsets: dict[str,list[str]]
@@ -579,18 +600,19 @@ class DocReader(object):
         ...
         AttributeError: Unknown field 'lon'. Expected one of ['lat']
         """
-        self.__dict__['_doc'] = doc
+        # __setattr__ writes through to the document, so set the slots directly
+        object.__setattr__(self, '_doc', doc)
 
         # The user-configurable search fields for this dataset type.
-        self.__dict__['_search_fields'] = {name: field
-                                           for name, field in search_fields.items()
-                                           if hasattr(field, 'extract')}
+        object.__setattr__(self, '_search_fields', {name: field
+                                                    for name, field in search_fields.items()
+                                                    if hasattr(field, 'extract')})
 
         # The field offsets that the datacube itself understands: id, format, sources etc.
         # (See the metadata-type-schema.yaml or the comments in default-metadata-types.yaml)
-        self.__dict__['_system_offsets'] = {name: field
-                                            for name, field in type_definition.items()
-                                            if name != 'search_fields'}
+        object.__setattr__(self, '_system_offsets', {name: field
+                                                     for name, field in type_definition.items()
+                                                     if name != 'search_fields'})
 
     def __getattr__(self, name):
         offset = self._system_offsets.get(name)
@@ -55,6 +55,11 @@ def _make_crs(crs_str):
     return crs
 
 
+@cachetools.cached({})
+def _canonical_proj4(crs_str):
+    return frozenset(_make_crs(crs_str).ExportToProj4().split() + ['+wktext'])
+
+
 class CRS(object):
     """
     Wrapper around `osr.SpatialReference` providing a more pythonic interface
@@ -203,8 +208,7 @@ class CRS(object):
     def __eq__(self, other):
         if isinstance(other, compat.string_types):
             other = CRS(other)
-        canonical = lambda crs: set(crs.ExportToProj4().split() + ['+wktext'])
-        return canonical(self._crs) == canonical(other._crs)  # pylint: disable=protected-access
+        return _canonical_proj4(self.crs_str) == _canonical_proj4(other.crs_str)
 
     def __ne__(self, other):
         if isinstance(other, compat.string_types):
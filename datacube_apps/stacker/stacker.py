@@ -146,15 +146,15 @@ def do_stack_task(config, task):
                                      variable_params,
                                      global_attributes)
 
-    for name, variable in data.data_vars.items():
-        try:
-            with dask.set_options(get=dask.async.get_sync):
-                da.store(variable.data, nco[name], lock=True)
-        except ValueError:
-            nco[name][:] = netcdf_writer.netcdfy_data(variable.values)
-        nco.sync()
-
-    nco.close()
+    try:
+        for name, variable in data.data_vars.items():
+            try:
+                with dask.set_options(get=dask.async.get_sync):
+                    da.store(variable.data, nco[name], lock=True)
+            except ValueError:
+                nco[name][:] = netcdf_writer.netcdfy_data(variable.values)
+    finally:
+        nco.close()
 
     def update_dataset_location(labels, dataset):
         new_dataset = copy.copy(dataset)
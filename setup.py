@@ -3,10 +3,11 @@
 import versioneer
 from setuptools import setup, find_packages
 
-tests_require = ['pytest', 'pytest-cov', 'mock', 'pep8', 'pylint==1.6.4', 'hypothesis', 'compliance-checker']
+tests_require = ['pytest', 'pytest-cov', 'pytest-xdist', 'mock', 'pep8', 'pylint==1.6.4', 'hypothesis',
+                 'compliance-checker']
 
 extras_require = {
-    'performance': ['ciso8601', 'bottleneck'],
+    'performance': ['ciso8601', 'bottleneck', 'ujson>=1.35'],
     'interactive': ['matplotlib', 'fiona'],
     'distributed': ['distributed', 'dask[distributed]'],
     'analytics': ['scipy', 'pyparsing', 'numexpr'],
@@ -34,7 +34,7 @@ def test_geo_xarray():
     width = 1000
     height = 1000
     da = xr.DataArray(
-        data=numpy.ones((4, 1000, 1000)),
+        data=numpy.ones((4, height, width), dtype='uint8'),
         coords={
             'time': numpy.linspace(1, 5, 4),
             'longitude': numpy.linspace(148, 148.24975, width),
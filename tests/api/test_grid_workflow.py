@@ -4,6 +4,18 @@ from datacube.model import GridSpec
 from datacube.utils import geometry
 
 
+class FakeDataset(object):
+    """
+    Only the dataset attributes GridWorkflow uses, so it can't rely on a mock's lax attribute access.
+    """
+    __slots__ = ('extent', 'center_time', 'type')
+
+    def __init__(self, extent, center_time, type_=None):
+        self.extent = extent
+        self.center_time = center_time
+        self.type = type_
+
+
 def test_gridworkflow():
     """ Test GridWorkflow with padding option. """
     from mock import MagicMock
@@ -21,9 +33,9 @@ def test_gridworkflow():
     # then this will be cell(1,-2).
     gridspec = GridSpec(crs=fakecrs, tile_size=(grid, grid), resolution=(-pixel, pixel))  # e.g. product gridspec
 
-    fakedataset = MagicMock()
-    fakedataset.extent = geometry.box(left=grid, bottom=-grid, right=2*grid, top=-2*grid, crs=fakecrs)
-    fakedataset.center_time = t = datetime.datetime(2001, 2, 15)
+    t = datetime.datetime(2001, 2, 15)
+    fakedataset = FakeDataset(geometry.box(left=grid, bottom=-grid, right=2*grid, top=-2*grid, crs=fakecrs), t,
+                              type_=MagicMock())
 
     fakeindex = MagicMock()
     fakeindex.datasets.get_field_names.return_value = ['time']  # permit query on time
@@ -48,9 +60,7 @@ def test_gridworkflow():
     # ------ add another dataset (to test grouping) -----
 
     # consider cell (2,-2)
-    fakedataset2 = MagicMock()
-    fakedataset2.extent = geometry.box(left=2*grid, bottom=-grid, right=3*grid, top=-2*grid, crs=fakecrs)
-    fakedataset2.center_time = t
+    fakedataset2 = FakeDataset(geometry.box(left=2*grid, bottom=-grid, right=3*grid, top=-2*grid, crs=fakecrs), t)
 
     def search_eager(lat=None, lon=None, **kwargs):
         return [fakedataset, fakedataset2]
@@ -124,3 +134,17 @@ def test_gridworkflow():
     assert len(padded_tile) == 1
     assert padded_tile[1, -2, ti].shape == (1, 14, 14)
     assert len(padded_tile[1, -2, ti].sources.values[0]) == 2
+
+
+def test_bounds_overlap():
+    from datacube.api.grid_workflow import _extent_bounds, _bounds_overlap
+
+    crs = geometry.CRS('EPSG:4326')
+    extents = [geometry.box(0, 0, 10, 10, crs=crs),
+               geometry.box(10, 0, 20, 10, crs=crs),  # touches the query box only along an edge
+               geometry.box(5, -5, 15, 5, crs=crs)]
+    bounds = _extent_bounds(extents)
+    assert bounds.shape == (3, 4)
+
+    query = geometry.box(0, 0, 10, 10, crs=crs).boundingbox
+    assert list(_bounds_overlap(bounds, query)) == [True, False, True]
@@ -7,6 +7,7 @@ from collections import namedtuple
 from contextlib import contextmanager
 from copy import deepcopy
 
+import mock
 import pytest
 from uuid import UUID
 
@@ -17,6 +18,7 @@ from datacube.model import DatasetType, MetadataType, Dataset
 _nbar_uuid = UUID('f2f12372-8366-11e5-817e-1040f381a756')
 _ortho_uuid = UUID('5cf41d98-eda9-11e4-8a8e-1040f381a756')
 _telemetry_uuid = UUID('4ec8fe97-e8b9-11e4-87ff-1040f381a756')
+_pq_uuid = UUID('b2b9f6a4-8366-11e5-93e9-1040f381a756')
 
 # An NBAR with source datasets. Many fields have been removed to keep it semi-focused to our ingest test.
 _EXAMPLE_NBAR = {
@@ -163,6 +165,7 @@ class MockDb(object):
     def __init__(self):
         self.dataset = {}
         self.dataset_source = set()
+        self.insert_attempts = []
 
     @contextmanager
     def begin(self):
@@ -175,10 +178,15 @@ class MockDb(object):
     def get_dataset(self, id):
         return self.dataset.get(id, None)
 
+    def contains_dataset(self, id_):
+        return id_ in self.dataset
+
     def ensure_dataset_location(self, *args, **kwargs):
         return
 
     def insert_dataset(self, metadata_doc, dataset_id, dataset_type_id):
+        self.insert_attempts.append(dataset_id)
+
         # Will we pretend this one was already ingested?
         if dataset_id in self.dataset:
             raise DuplicateRecordError('already ingested')
@@ -187,8 +195,16 @@ class MockDb(object):
                                                  None, None, None, None)
         return True
 
-    def insert_dataset_source(self, classifier, dataset_id, source_dataset_id):
-        self.dataset_source.add((classifier, dataset_id, source_dataset_id))
+    def insert_dataset_sources(self, sources):
+        self.dataset_source.update(sources)
+
+    def update_dataset(self, metadata_doc, dataset_id, dataset_type_id):
+        if dataset_id not in self.dataset:
+            return False
+
+        self.dataset[dataset_id] = self.dataset[dataset_id]._replace(metadata=deepcopy(metadata_doc),
+                                                                     dataset_type_ref=dataset_type_id)
+        return True
 
 
 class MockTypesResource(object):
@@ -259,3 +275,81 @@ def test_index_two_levels_already_ingested():
     dataset = datasets.add(_EXAMPLE_NBAR_DATASET)
     assert len(mock_db.dataset) == 3
     assert len(mock_db.dataset_source) == 2
+
+
+def test_update_dataset():
+    mock_db = MockDb()
+    mock_types = MockTypesResource(_EXAMPLE_DATASET_TYPE)
+    datasets = DatasetResource(mock_db, mock_types)
+    datasets.add(_EXAMPLE_NBAR_DATASET)
+
+    updated = deepcopy(_EXAMPLE_NBAR_DATASET)
+    updated.metadata_doc['size_bytes'] = 4551
+
+    # can_update() needs the full provenance query, which MockDb doesn't implement
+    safe_changes = [(('size_bytes',), 4550, 4551)]
+    with mock.patch.object(DatasetResource, 'can_update', return_value=(True, safe_changes, [])):
+        assert datasets.update(updated) is updated
+
+    assert mock_db.dataset[_nbar_uuid].metadata['size_bytes'] == 4551
+
+
+def _build_pq_dataset(sources):
+    """A PQ dataset derived from the given (already built) source datasets."""
+    doc = {
+        'id': str(_pq_uuid),
+        'product_type': 'pqa',
+        'ga_label': 'LS8_OLITIRS_PQ_P55_GAPQ01-002_112_079_20140126',
+        'lineage': {
+            'source_datasets': {name: deepcopy(source.metadata_doc) for name, source in sources.items()}
+        }
+    }
+    return Dataset(_EXAMPLE_DATASET_TYPE, doc, 'file://test.zzz', sources)
+
+
+@pytest.mark.parametrize('sources_policy', ['verify', 'ensure'])
+def test_index_diamond_lineage(sources_policy):
+    mock_db = MockDb()
+    mock_types = MockTypesResource(_EXAMPLE_DATASET_TYPE)
+    datasets = DatasetResource(mock_db, mock_types)
+
+    # PQ -> {NBAR -> Ortho -> Telemetry, Ortho -> Telemetry}: the ortho lineage is shared
+    nbar = _build_dataset(deepcopy(_EXAMPLE_NBAR))
+    ortho = _build_dataset(deepcopy(_EXAMPLE_NBAR['lineage']['source_datasets']['ortho']))
+    datasets.add(_build_pq_dataset({'nbar': nbar, 'level1': ortho}), sources_policy=sources_policy)
+
+    # Every dataset is inserted exactly once, each after its own sources
+    assert len(mock_db.insert_attempts) == 4
+    assert set(mock_db.insert_attempts) == {_pq_uuid, _nbar_uuid, _ortho_uuid, _telemetry_uuid}
+    order = mock_db.insert_attempts.index
+    assert order(_telemetry_uuid) < order(_ortho_uuid) < order(_nbar_uuid) < order(_pq_uuid)
+
+    assert mock_db.dataset_source == {
+        ('nbar', _pq_uuid, _nbar_uuid),
+        ('level1', _pq_uuid, _ortho_uuid),
+        ('ortho', _nbar_uuid, _ortho_uuid),
+        ('satellite_telemetry_data', _ortho_uuid, _telemetry_uuid)
+    }
+
+
+def test_index_ensure_indexed_sources_without_lineage():
+    mock_db = MockDb()
+    mock_types = MockTypesResource(_EXAMPLE_DATASET_TYPE)
+    datasets = DatasetResource(mock_db, mock_types)
+    datasets.add(_EXAMPLE_NBAR_DATASET)
+    del mock_db.insert_attempts[:]
+
+    # As if loaded from the index without include_sources=True
+    nbar = Dataset(_EXAMPLE_DATASET_TYPE, deepcopy(_EXAMPLE_NBAR), 'file://test.zzz')
+    assert nbar.sources is None
+    pq = _build_pq_dataset({'nbar': nbar})
+
+    # Verifying needs the full lineage...
+    with pytest.raises(ValueError):
+        datasets.add(pq, sources_policy='verify')
+    assert mock_db.insert_attempts == []
+
+    # ...but 'ensure' doesn't look past sources that are already indexed
+    datasets.add(pq, sources_policy='ensure')
+    assert mock_db.insert_attempts == [_pq_uuid]
+    assert ('nbar', _pq_uuid, _nbar_uuid) in mock_db.dataset_source
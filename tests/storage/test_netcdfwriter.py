@@ -69,79 +69,45 @@ DATA_HEIGHT = 200
 
 
 def _ensure_spheroid(var):
-    assert 'semi_major_axis' in var.ncattrs()
-    assert 'semi_minor_axis' in var.ncattrs()
-    assert 'inverse_flattening' in var.ncattrs()
+    assert {'semi_major_axis', 'semi_minor_axis', 'inverse_flattening'} <= set(var.ncattrs())
 
 
 def _ensure_gdal(var):
-    assert 'GeoTransform' in var.ncattrs()
-    assert 'spatial_ref' in var.ncattrs()
+    assert {'GeoTransform', 'spatial_ref'} <= set(var.ncattrs())
 
 
 def _ensure_geospatial(nco):
-    assert 'geospatial_bounds' in nco.ncattrs()
-    assert 'geospatial_bounds_crs' in nco.ncattrs()
-    assert nco.getncattr('geospatial_bounds_crs') == "EPSG:4326"
+    assert {'geospatial_bounds', 'geospatial_bounds_crs',
+            'geospatial_lat_min', 'geospatial_lat_max', 'geospatial_lat_units',
+            'geospatial_lon_min', 'geospatial_lon_max', 'geospatial_lon_units'} <= set(nco.ncattrs())
 
-    assert 'geospatial_lat_min' in nco.ncattrs()
-    assert 'geospatial_lat_max' in nco.ncattrs()
-    assert 'geospatial_lat_units' in nco.ncattrs()
+    assert nco.getncattr('geospatial_bounds_crs') == "EPSG:4326"
     assert nco.getncattr('geospatial_lat_units') == "degrees_north"
-
-    assert 'geospatial_lon_min' in nco.ncattrs()
-    assert 'geospatial_lon_max' in nco.ncattrs()
-    assert 'geospatial_lon_units' in nco.ncattrs()
     assert nco.getncattr('geospatial_lon_units') == "degrees_east"
 
 
-def test_create_albers_projection_netcdf(tmpnetcdf_filename):
+@pytest.mark.parametrize('crs, coordinates, grid_mapping_name, grid_mapping_attrs', [
+    (ALBERS_PROJ, PROJECTED_COORDINATES, 'albers_conical_equal_area',
+     ('standard_parallel', 'longitude_of_central_meridian', 'latitude_of_projection_origin')),
+    (GEO_PROJ, LAT_LON_COORDINATES, 'latitude_longitude', ()),
+    (SINIS_PROJ, PROJECTED_COORDINATES, 'sinusoidal', ('longitude_of_central_meridian',)),
+], ids=['albers', 'epsg4326', 'sinusoidal'])
+def test_create_grid_mapping_netcdf(tmpnetcdf_filename, crs, coordinates, grid_mapping_name, grid_mapping_attrs):
     nco = create_netcdf(tmpnetcdf_filename)
-    create_coordinate(nco, 'x', numpy.array([1., 2., 3.]), 'm')
-    create_coordinate(nco, 'y', numpy.array([1., 2., 3.]), 'm')
-    create_grid_mapping_variable(nco, ALBERS_PROJ)
+    for name in coordinates:
+        create_coordinate(nco, name, numpy.array([1., 2., 3.]), 'm')
+    create_grid_mapping_variable(nco, crs)
     nco.close()
 
     with netCDF4.Dataset(tmpnetcdf_filename) as nco:
         assert 'crs' in nco.variables
-        assert nco['crs'].grid_mapping_name == 'albers_conical_equal_area'
-        assert 'standard_parallel' in nco['crs'].ncattrs()
-        assert 'longitude_of_central_meridian' in nco['crs'].ncattrs()
-        assert 'latitude_of_projection_origin' in nco['crs'].ncattrs()
+        assert nco['crs'].grid_mapping_name == grid_mapping_name
+        assert set(grid_mapping_attrs) <= set(nco['crs'].ncattrs())
         _ensure_spheroid(nco['crs'])
         _ensure_gdal(nco['crs'])
         _ensure_geospatial(nco)
 
 
-def test_create_epsg4326_netcdf(tmpnetcdf_filename):
-    nco = create_netcdf(tmpnetcdf_filename)
-    create_coordinate(nco, 'latitude', numpy.array([1., 2., 3.]), 'm')
-    create_coordinate(nco, 'longitude', numpy.array([1., 2., 3.]), 'm')
-    create_grid_mapping_variable(nco, GEO_PROJ)
-    nco.close()
-
-    with netCDF4.Dataset(tmpnetcdf_filename) as nco:
-        assert 'crs' in nco.variables
-        assert nco['crs'].grid_mapping_name == 'latitude_longitude'
-        _ensure_spheroid(nco['crs'])
-        _ensure_geospatial(nco)
-
-
-def test_create_sinus_netcdf(tmpnetcdf_filename):
-    nco = create_netcdf(tmpnetcdf_filename)
-    create_coordinate(nco, 'x', numpy.array([1., 2., 3.]), 'm')
-    create_coordinate(nco, 'y', numpy.array([1., 2., 3.]), 'm')
-    create_grid_mapping_variable(nco, SINIS_PROJ)
-    nco.close()
-
-    with netCDF4.Dataset(tmpnetcdf_filename) as nco:
-        assert 'crs' in nco.variables
-        assert nco['crs'].grid_mapping_name == 'sinusoidal'
-        assert 'longitude_of_central_meridian' in nco['crs'].ncattrs()
-        _ensure_spheroid(nco['crs'])
-        _ensure_geospatial(nco)
-
-
 # Work around outstanding bug with hypothesis/pytest, where function level fixtures are only run once.
 # Generate a new netcdf filename for each run, so that old files don't cause permission errors on windows
 # due to antivirus software filesystem lag.
@@ -175,11 +141,18 @@ def test_chunksizes(tmpnetcdf_filename):
     no_chunks = create_variable(nco, 'no_chunks', Variable(numpy.dtype('int16'), None, ('greg', 'bleh'), None))
     min_max_chunks = create_variable(nco, 'min_max_chunks', Variable(numpy.dtype('int16'), None,
                                                                      ('greg', 'bleh'), None), chunksizes=[2, 50])
+    whole_chunk = create_variable(nco, 'whole_chunk', Variable(numpy.dtype('int16'), None,
+                                                               ('greg', 'bleh'), None), chunksizes=[3, 50])
+    whole_chunk_zlib = create_variable(nco, 'whole_chunk_zlib', Variable(numpy.dtype('int16'), None,
+                                                                         ('greg', 'bleh'), None),
+                                       chunksizes=[3, 50], zlib=True)
     nco.close()
 
     with netCDF4.Dataset(tmpnetcdf_filename) as nco:
         assert nco['no_chunks'].chunking() == 'contiguous'
         assert nco['min_max_chunks'].chunking() == [2, 5]
+        assert nco['whole_chunk'].chunking() == 'contiguous'
+        assert nco['whole_chunk_zlib'].chunking() == [3, 5]
 
 
 EXAMPLE_FLAGS_DEF = {
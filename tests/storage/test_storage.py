@@ -13,23 +13,27 @@ import rasterio.warp
 import datacube
 from datacube.utils import geometry
 from datacube.storage.storage import write_dataset_to_netcdf, reproject_and_fuse, read_from_source, Resampling
-from datacube.storage.storage import NetCDFDataSource
+from datacube.storage.storage import create_netcdf_storage_unit
+from datacube.storage.storage import NetCDFDataSource, OverrideBandDataSource
 
 GEO_PROJ = 'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,AUTHORITY["EPSG","7030"]],' \
            'AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0],UNIT["degree",0.0174532925199433],' \
            'AUTHORITY["EPSG","4326"]]'
 
 
-def test_write_dataset_to_netcdf(tmpnetcdf_filename):
-    affine = Affine.scale(0.1, 0.1) * Affine.translation(20, 30)
-    geobox = geometry.GeoBox(100, 100, affine, geometry.CRS(GEO_PROJ))
+def _make_xarray_dataset(geobox, data, nodata):
     dataset = xarray.Dataset(attrs={'extent': geobox.extent, 'crs': geobox.crs})
     for name, coord in geobox.coordinates.items():
         dataset[name] = (name, coord.values, {'units': coord.units, 'crs': geobox.crs})
 
-    dataset['B10'] = (geobox.dimensions,
-                      numpy.arange(10000, dtype='int16').reshape(geobox.shape),
-                      {'nodata': 0, 'units': '1', 'crs': geobox.crs})
+    dataset['B10'] = (geobox.dimensions, data, {'nodata': nodata, 'units': '1', 'crs': geobox.crs})
+    return dataset
+
+
+def test_write_dataset_to_netcdf(tmpnetcdf_filename):
+    affine = Affine.scale(0.1, 0.1) * Affine.translation(20, 30)
+    geobox = geometry.GeoBox(100, 100, affine, geometry.CRS(GEO_PROJ))
+    dataset = _make_xarray_dataset(geobox, numpy.arange(10000, dtype='int16').reshape(geobox.shape), nodata=0)
 
     write_dataset_to_netcdf(dataset, tmpnetcdf_filename, global_attributes={'foo': 'bar'},
                             variable_params={'B10': {'attrs': {'abc': 'xyz'}}})
@@ -38,6 +42,7 @@ def test_write_dataset_to_netcdf(tmpnetcdf_filename):
         nco.set_auto_mask(False)
         assert 'B10' in nco.variables
         var = nco.variables['B10']
+        assert var.shape == geobox.shape
         assert (var[:] == dataset['B10'].values).all()
 
         assert 'foo' in nco.ncattrs()
@@ -47,16 +52,52 @@ def test_write_dataset_to_netcdf(tmpnetcdf_filename):
         assert var.getncattr('abc') == 'xyz'
 
 
+class _RecordingStorageUnit(object):
+    """Stands in for the netCDF4.Dataset returned by create_netcdf_storage_unit, recording variable writes"""
+    def __init__(self, nco):
+        self.nco = nco
+        self.written = []
+
+    def __getitem__(self, name):
+        self.written.append(name)
+        return self.nco[name]
+
+    def close(self):
+        self.nco.close()
+
+
+def test_write_nodata_dataset_to_netcdf(tmpnetcdf_filename):
+    affine = Affine.scale(0.1, 0.1) * Affine.translation(20, 30)
+    geobox = geometry.GeoBox(100, 100, affine, geometry.CRS(GEO_PROJ))
+    dataset = _make_xarray_dataset(geobox, numpy.full(geobox.shape, -999, dtype='int16'), nodata=-999)
+    dataset['B20'] = (geobox.dimensions,
+                      numpy.arange(10000, dtype='int16').reshape(geobox.shape),
+                      {'nodata': -999, 'units': '1', 'crs': geobox.crs})
+
+    storage_units = []
+
+    def create_recording_storage_unit(*args, **kwargs):
+        storage_units.append(_RecordingStorageUnit(create_netcdf_storage_unit(*args, **kwargs)))
+        return storage_units[-1]
+
+    with mock.patch('datacube.storage.storage.create_netcdf_storage_unit', side_effect=create_recording_storage_unit):
+        write_dataset_to_netcdf(dataset, tmpnetcdf_filename)
+
+    # Only the variable with real data is written, B10 is left to its fill value
+    assert [unit.written for unit in storage_units] == [['B20']]
+
+    with netCDF4.Dataset(tmpnetcdf_filename) as nco:
+        nco.set_auto_mask(False)
+        var = nco.variables['B10']
+        assert var.shape == geobox.shape
+        assert (var[:] == -999).all()
+        assert (nco.variables['B20'][:] == dataset['B20'].values).all()
+
+
 def test_netcdf_source(tmpnetcdf_filename):
     affine = Affine.scale(0.1, 0.1) * Affine.translation(20, 30)
     geobox = geometry.GeoBox(110, 100, affine, geometry.CRS(GEO_PROJ))
-    dataset = xarray.Dataset(attrs={'extent': geobox.extent, 'crs': geobox.crs})
-    for name, coord in geobox.coordinates.items():
-        dataset[name] = (name, coord.values, {'units': coord.units, 'crs': geobox.crs})
-
-    dataset['B10'] = (geobox.dimensions,
-                      numpy.arange(11000, dtype='int16').reshape(geobox.shape),
-                      {'nodata': 0, 'units': '1', 'crs': geobox.crs})
+    dataset = _make_xarray_dataset(geobox, numpy.arange(11000, dtype='int16').reshape(geobox.shape), nodata=0)
 
     write_dataset_to_netcdf(dataset, tmpnetcdf_filename, global_attributes={'foo': 'bar'},
                             variable_params={'B10': {'attrs': {'abc': 'xyz'}}})
@@ -64,6 +105,7 @@ def test_netcdf_source(tmpnetcdf_filename):
     with netCDF4.Dataset(tmpnetcdf_filename) as nco:
         nco.set_auto_mask(False)
         source = NetCDFDataSource(nco, 'B10')
+        assert source.shape == geobox.shape
         assert source.crs == geobox.crs
         assert source.transform.almost_equals(affine)
         assert (source.read() == dataset['B10']).all()
@@ -100,6 +142,29 @@ def test_netcdf_source(tmpnetcdf_filename):
         assert (dest[10:60, 10:65] == dataset['B10'][1::2, 1::2]).all()
 
 
+def test_override_band_source_reproject(tmpdir):
+    # A file without georeferencing, so the source's CRS and transform have to be supplied
+    data = numpy.arange(100, dtype='int16').reshape(10, 10)
+    filename = str(tmpdir.join('not_georeferenced.tif'))
+    with rasterio.open(filename, 'w', driver='GTiff', width=10, height=10, count=1, dtype='int16') as dst:
+        dst.write(data, 1)
+
+    crs = geometry.CRS(GEO_PROJ)
+    affine = Affine.translation(150, -30) * Affine.scale(0.1, -0.1)
+    with rasterio.open(filename) as src:
+        source = OverrideBandDataSource(rasterio.band(src, 1), nodata=-999, crs=crs, transform=affine)
+        assert (source.read() == data).all()
+
+        dest = numpy.empty((5, 5), dtype='int16')
+        source.reproject(dest, affine * Affine.translation(2, 3), crs, -999, Resampling.nearest)
+        assert (dest == data[3:8, 2:7]).all()
+
+        dest = numpy.full((10, 10), -999, dtype='int16')
+        source.reproject(dest, affine * Affine.translation(-5, -5), crs, -999, Resampling.nearest)
+        assert (dest[5:, 5:] == data[:5, :5]).all()
+        assert (dest[:5, :] == -999).all()
+
+
 def test_first_source_is_priority_in_reproject_and_fuse():
     crs = mock.MagicMock()
     shape = (2, 2)
@@ -187,22 +252,6 @@ def test_read_from_broken_source():
     assert (output_data == [[2, 2], [2, 2]]).all()
 
 
-def _create_broken_netcdf(tmpdir):
-    import os
-    output_path = str(tmpdir / 'broken_netcdf_file.nc')
-    with netCDF4.Dataset('broken_netcdf_file.nc', 'w') as nco:
-        nco.createDimension('x', 50)
-        nco.createDimension('y', 50)
-        nco.createVariable('blank', 'int16', ('y', 'x'))
-
-    with open(output_path, 'rb+') as filehandle:
-        filehandle.seek(-3, os.SEEK_END)
-        filehandle.truncate()
-
-    with netCDF4.Dataset(output_path) as nco:
-        blank = nco.data_vars['blank']
-
-
 class FakeDataSource(object):
     def __init__(self):
         self.crs = geometry.CRS('EPSG:4326')
@@ -3,6 +3,7 @@ Test date sequence generation functions as used by statistics apps
 
 
 """
+import json
 import os
 
 import pytest
@@ -11,7 +12,7 @@ from pandas import to_datetime
 from hypothesis import given
 from hypothesis.strategies import integers
 
-from datacube.utils import uri_to_local_path, clamp
+from datacube.utils import uri_to_local_path, clamp, read_documents
 from datacube.utils.dates import date_sequence
 
 
@@ -84,3 +85,19 @@ def test_clamp(x, lower_bound, upper_bound):
     if lower_bound <= x <= upper_bound:
         assert new_x == x
     assert lower_bound <= new_x <= upper_bound
+
+
+def test_read_json_documents_floats_match_json_module(tmpdir):
+    # Coordinates as found in dataset documents, plus values that need all 17 significant digits
+    doc = {
+        'extent': {'coord': {'ul': {'lat': -26.37259, 'lon': 116.58914},
+                             'lr': {'lat': -28.48062, 'lon': 118.96145}}},
+        'geo_ref_points': {'ul': {'x': 459012.5, 'y': 7082987.5}},
+        'values': [0.1, 1e-7, 151.999875, -29.00025, 1234567.1234567891] + [i / 7.0 for i in range(-50, 50)]
+    }
+    path = tmpdir.join('floats.json')
+    path.write(json.dumps(doc))
+
+    documents = list(read_documents(str(path)))
+    assert len(documents) == 1
+    assert documents[0][1] == json.loads(path.read())